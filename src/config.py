@@ -9,6 +9,7 @@ class Config:
     project_root = Path(__file__).resolve().parents[1]
     raw_path = Path(f"{project_root}/data/raw/{event}")
     public_path = Path(f"{project_root}/data/public/{event}")
+    website_url = f"https://ep{event.split('-')[1]}.europython.eu"
 
     @classmethod
     def token(cls) -> str:
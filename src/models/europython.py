@@ -6,7 +6,6 @@ from pydantic import BaseModel, Field, computed_field, field_validator, model_va
 
 from src.config import Config
 from src.misc import EventType, Room, SpeakerQuestion, SubmissionQuestion
-from src.models.pretalx import PretalxAnswer
 
 
 class EuroPythonSpeaker(BaseModel):
@@ -19,7 +18,6 @@ class EuroPythonSpeaker(BaseModel):
     biography: str | None = None
     avatar: str
     slug: str
-    answers: list[PretalxAnswer] = Field(..., exclude=True)
     submissions: list[str]
 
     # Extracted
@@ -32,39 +30,30 @@ class EuroPythonSpeaker(BaseModel):
 
     @computed_field
     def website_url(self) -> str:
-        return (
-            f"https://ep{Config.event.split('-')[1]}.europython.eu/speaker/{self.slug}"
-        )
+        return f"{Config.website_url}/speaker/{self.slug}"
 
     @model_validator(mode="before")
     @classmethod
     def extract_answers(cls, values) -> dict:
-        answers = [PretalxAnswer.model_validate(ans) for ans in values["answers"]]
+        answer_texts = values.pop("answers", {})
 
-        for answer in answers:
-            if answer.question_text == SpeakerQuestion.affiliation:
-                values["affiliation"] = answer.answer_text
+        if (text := answer_texts.get(SpeakerQuestion.affiliation)) is not None:
+            values["affiliation"] = text
 
-            if answer.question_text == SpeakerQuestion.homepage:
-                values["homepage"] = answer.answer_text
+        if (text := answer_texts.get(SpeakerQuestion.homepage)) is not None:
+            values["homepage"] = text
 
-            if answer.question_text == SpeakerQuestion.twitter:
-                values["twitter_url"] = cls.extract_twitter_url(
-                    answer.answer_text.strip().split()[0]
-                )
+        if (text := answer_texts.get(SpeakerQuestion.twitter)) is not None:
+            values["twitter_url"] = cls.extract_twitter_url(text.strip().split()[0])
 
-            if answer.question_text == SpeakerQuestion.mastodon:
-                values["mastodon_url"] = cls.extract_mastodon_url(
-                    answer.answer_text.strip().split()[0]
-                )
+        if (text := answer_texts.get(SpeakerQuestion.mastodon)) is not None:
+            values["mastodon_url"] = cls.extract_mastodon_url(text.strip().split()[0])
 
-            if answer.question_text == SpeakerQuestion.linkedin:
-                values["linkedin_url"] = cls.extract_linkedin_url(
-                    answer.answer_text.strip().split()[0]
-                )
+        if (text := answer_texts.get(SpeakerQuestion.linkedin)) is not None:
+            values["linkedin_url"] = cls.extract_linkedin_url(text.strip().split()[0])
 
-            if answer.question_text == SpeakerQuestion.gitx:
-                values["gitx"] = answer.answer_text.strip().split()[0]
+        if (text := answer_texts.get(SpeakerQuestion.gitx)) is not None:
+            values["gitx"] = text.strip().split()[0]
 
         return values
 
@@ -135,7 +124,6 @@ class EuroPythonSession(BaseModel):
     room: str | None = None
     start: datetime | None = None
     end: datetime | None = None
-    answers: list[PretalxAnswer] = Field(..., exclude=True)
     sessions_in_parallel: list[str] | None = None
     sessions_after: list[str] | None = None
     sessions_before: list[str] | None = None
@@ -153,28 +141,25 @@ class EuroPythonSession(BaseModel):
 
     @computed_field
     def website_url(self) -> str:
-        return (
-            f"https://ep{Config.event.split('-')[1]}.europython.eu/session/{self.slug}"
-        )
+        return f"{Config.website_url}/session/{self.slug}"
 
     @model_validator(mode="before")
     @classmethod
     def extract_answers(cls, values) -> dict:
-        answers = [PretalxAnswer.model_validate(ans) for ans in values["answers"]]
+        answer_texts = values.pop("answers", {})
 
-        for answer in answers:
-            # TODO if we need any other questions
-            if answer.question_text == SubmissionQuestion.tweet:
-                values["tweet"] = answer.answer_text
+        # TODO if we need any other questions
+        if (text := answer_texts.get(SubmissionQuestion.tweet)) is not None:
+            values["tweet"] = text
 
-            if answer.question_text == SubmissionQuestion.delivery:
-                if "in-person" in answer.answer_text:
-                    values["delivery"] = "in-person"
-                else:
-                    values["delivery"] = "remote"
+        if (text := answer_texts.get(SubmissionQuestion.delivery)) is not None:
+            if "in-person" in text:
+                values["delivery"] = "in-person"
+            else:
+                values["delivery"] = "remote"
 
-            if answer.question_text == SubmissionQuestion.level:
-                values["level"] = answer.answer_text.lower()
+        if (text := answer_texts.get(SubmissionQuestion.level)) is not None:
+            values["level"] = text.lower()
 
         return values
 
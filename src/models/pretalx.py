@@ -1,40 +1,19 @@
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, BeforeValidator, Field, field_validator, model_validator
 
 from src.misc import SubmissionState
 
-
-class PretalxAnswer(BaseModel):
-    question_text: str
-    answer_text: str
-    answer_file: str | None = None
-    submission_id: str | None = None
-    speaker_id: str | None = None
-
-    @model_validator(mode="before")
-    @classmethod
-    def extract(cls, values) -> dict:
-        values["question_text"] = values["question"]["question"]["en"]
-        values["answer_text"] = values["answer"]
-        values["answer_file"] = values["answer_file"]
-        values["submission_id"] = values["submission"]
-        values["speaker_id"] = values["person"]
-        return values
-
-
-class PretalxSlot(BaseModel):
-    room: str | None = None
-    start: datetime | None = None
-    end: datetime | None = None
-
-    @field_validator("room", mode="before")
-    @classmethod
-    def handle_localized(cls, v) -> str | None:
-        if isinstance(v, dict):
-            return v.get("en")
-        return v
+# The Pretalx answers, indexed as answer texts by question text
+AnswerTexts = Annotated[
+    dict[str, str],
+    BeforeValidator(
+        lambda answers: {
+            answer["question"]["question"]["en"]: answer["answer"] for answer in answers
+        }
+    ),
+]
 
 
 class PretalxSpeaker(BaseModel):
@@ -47,7 +26,7 @@ class PretalxSpeaker(BaseModel):
     biography: str | None = None
     avatar: str
     submissions: list[str]
-    answers: list[PretalxAnswer]
+    answers: AnswerTexts
 
 
 class PretalxSubmission(BaseModel):
@@ -64,8 +43,7 @@ class PretalxSubmission(BaseModel):
     abstract: str = ""
     duration: str = ""
     resources: list[dict[str, str]] | None = None
-    answers: list[PretalxAnswer]
-    slot: PretalxSlot | None = Field(..., exclude=True)
+    answers: AnswerTexts
     slot_count: int = Field(..., exclude=True)
 
     # Extracted from slot data
@@ -73,7 +51,7 @@ class PretalxSubmission(BaseModel):
     start: datetime | None = None
     end: datetime | None = None
 
-    @field_validator("submission_type", "track", mode="before")
+    @field_validator("submission_type", "track", "room", mode="before")
     @classmethod
     def handle_localized(cls, v) -> str | None:
         if isinstance(v, dict):
@@ -95,14 +73,17 @@ class PretalxSubmission(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def process_values(cls, values) -> dict:
-        values["speakers"] = sorted([s["code"] for s in values["speakers"]])
-
-        # Set slot information
-        if values.get("slot"):
-            slot = PretalxSlot.model_validate(values["slot"])
-            values["room"] = slot.room
-            values["start"] = slot.start
-            values["end"] = slot.end
+        values["speakers"] = sorted(s["code"] for s in values["speakers"])
+
+        # Set slot information, the slot itself is not kept on the model
+        if "slot" not in values:
+            raise ValueError("Submission has no slot")
+        if (slot := values["slot"]) is not None:
+            if not isinstance(slot, dict) or not {"start", "end"} <= slot.keys():
+                raise ValueError(f"Malformed slot: {slot!r}")
+            values["room"] = slot.get("room")
+            values["start"] = slot.get("start")
+            values["end"] = slot.get("end")
 
         return values
 
@@ -121,23 +102,13 @@ class PretalxScheduleBreak(BaseModel):
     end: datetime
     description: dict[str, str] | str
 
-    @field_validator("description", mode="before")
+    @field_validator("room", "description", mode="before")
     @classmethod
     def handle_localized(cls, v) -> str | Any:
         if isinstance(v, dict):
             return v.get("en")
         return v
 
-    @model_validator(mode="before")
-    @classmethod
-    def set_slot_info(cls, values) -> dict:
-        slot = PretalxSlot.model_validate(values)
-        values["room"] = slot.room
-        values["start"] = slot.start
-        values["end"] = slot.end
-
-        return values
-
 
 class PretalxSchedule(BaseModel):
     """
@@ -1,10 +1,16 @@
-import json
 from collections.abc import KeysView
 from pathlib import Path
 
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+
 from src.models.pretalx import PretalxSchedule, PretalxSpeaker, PretalxSubmission
 from src.utils.utils import Utils
 
+# Validating straight from the raw JSON bytes parses and validates in one pass
+submissions_adapter = TypeAdapter(list[PretalxSubmission])
+speakers_adapter = TypeAdapter(list[PretalxSpeaker])
+
 
 class Parse:
     @staticmethod
@@ -12,13 +18,12 @@ class Parse:
         """
         Returns only publishable submissions
         """
-        with open(input_file) as fd:
-            js = json.load(fd)
-            all_submissions = [PretalxSubmission.model_validate(s) for s in js]
-            publishable_submissions = [s for s in all_submissions if s.is_publishable]
-            publishable_submissions_by_code = {
-                s.code: s for s in publishable_submissions
-            }
+        all_submissions = submissions_adapter.validate_json(
+            Path(input_file).read_bytes()
+        )
+        publishable_submissions_by_code = {
+            s.code: s for s in all_submissions if s.is_publishable
+        }
 
         return publishable_submissions_by_code
 
@@ -30,21 +35,15 @@ class Parse:
         """
         Returns only speakers with publishable sessions
         """
-        with open(input_file) as fd:
-            js = json.load(fd)
-            all_speakers = [PretalxSpeaker.model_validate(s) for s in js]
-
-            speakers_with_publishable_sessions: list[PretalxSubmission] = []
-            for speaker in all_speakers:
-                if publishable_sessions := Utils.publishable_sessions_of_speaker(
-                    speaker, publishable_sessions_keys
-                ):
-                    speaker.submissions = publishable_sessions
-                    speakers_with_publishable_sessions.append(speaker)
+        all_speakers = speakers_adapter.validate_json(Path(input_file).read_bytes())
 
-            publishable_speakers_by_code = {
-                s.code: s for s in speakers_with_publishable_sessions
-            }
+        publishable_speakers_by_code: dict[str, PretalxSpeaker] = {}
+        for speaker in all_speakers:
+            if publishable_sessions := Utils.publishable_sessions_of_speaker(
+                speaker, publishable_sessions_keys
+            ):
+                speaker.submissions = publishable_sessions
+                publishable_speakers_by_code[speaker.code] = speaker
 
         return publishable_speakers_by_code
 
@@ -56,9 +55,7 @@ class Parse:
         PretalxSchedule.slots: list[PretalxSubmission]
         PretalxSchedule.breaks: list[PretalxScheduleBreak]
         """
-        with open(input_file) as fd:
-            js = json.load(fd)
-            schedule = PretalxSchedule.model_validate(js)
+        schedule = PretalxSchedule.model_validate_json(Path(input_file).read_bytes())
 
         return schedule
 
@@ -67,8 +64,7 @@ class Parse:
         """
         Returns the Session code to YouTube URL mapping
         """
-        with open(input_file) as fd:
-            js = json.load(fd)
-            youtube_data = {s["submission"]: s["youtube_link"] for s in js}
+        js = from_json(Path(input_file).read_bytes())
+        youtube_data = {s["submission"]: s["youtube_link"] for s in js}
 
         return youtube_data
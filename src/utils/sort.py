@@ -10,18 +10,30 @@ class Sort:
         def get_sort_key(item):
             return tuple(item.get(key, "") for key in sort_keys)
 
+        # Only recurse into containers, the other values are returned as they are
         if isinstance(data, dict):
             return {
-                key: Sort.sort_nested(value, sort_keys)
+                key: (
+                    Sort.sort_nested(value, sort_keys)
+                    if isinstance(value, (dict, list))
+                    else value
+                )
                 for key, value in sorted(data.items())
             }
         elif isinstance(data, list):
-            if all(isinstance(item, dict) for item in data):
-                return sorted(
-                    (Sort.sort_nested(item, sort_keys) for item in data),
-                    key=get_sort_key,
+            items = [
+                (
+                    Sort.sort_nested(item, sort_keys)
+                    if isinstance(item, (dict, list))
+                    else item
                 )
+                for item in data
+            ]
+            # The dumped lists hold a single type, so checking the first item is
+            # enough to tell a list of dicts, mixed lists cannot be sorted anyway
+            if items and isinstance(items[0], dict):
+                return sorted(items, key=get_sort_key)
             else:
-                return sorted(Sort.sort_nested(item, sort_keys) for item in data)
+                return sorted(items)
         else:
             return data
@@ -1,4 +1,7 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from collections.abc import ValuesView
+from datetime import date, datetime, timedelta
 
 from src.models.pretalx import PretalxSubmission
 
@@ -14,28 +17,79 @@ class TimingRelationships:
     def compute(
         cls, all_sessions: ValuesView[PretalxSubmission] | list[PretalxSubmission]
     ) -> None:
-        for session in all_sessions:
-            if not session.start or not session.end:
-                continue
+        # Start from empty results, so sessions of an earlier call do not linger
+        cls.all_sessions_in_parallel = {}
+        cls.all_sessions_after = {}
+        cls.all_sessions_before = {}
+        cls.all_next_session = {}
+        cls.all_prev_session = {}
+
+        # Only the scheduled sessions have timing relationships
+        scheduled_sessions = [s for s in all_sessions if s.start and s.end]
+
+        # Sort the scheduled sessions by start time once, so that the sessions in
+        # parallel can be found with a binary search on the start times
+        sessions_by_start = sorted(scheduled_sessions, key=lambda x: x.start)
+        start_times = [s.start for s in sessions_by_start]
+        longest_duration = max(
+            (s.end - s.start for s in sessions_by_start), default=timedelta(0)
+        )
 
+        # Group the scheduled sessions by day, sorted by start time early first,
+        # so that the before/after lookups only scan the sessions of the same day
+        sessions_by_day: dict[date, list[PretalxSubmission]] = defaultdict(list)
+        for session in sessions_by_start:
+            sessions_by_day[session.start.date()].append(session)
+
+        sessions_by_day_reversed = {
+            day: sorted(sessions, key=lambda x: x.start, reverse=True)
+            for day, sessions in sessions_by_day.items()
+        }
+        start_times_by_day = {
+            day: [s.start for s in sessions]
+            for day, sessions in sessions_by_day.items()
+        }
+
+        # Index the sessions by code, keeping their position in the given order
+        sessions_by_code = {
+            s.code: (position, s) for position, s in enumerate(all_sessions)
+        }
+
+        for session in scheduled_sessions:
             sessions_in_parallel = cls.compute_sessions_in_parallel(
-                session, all_sessions
+                session, sessions_by_start, start_times, longest_duration
             )
+            # Only used for membership checks in the before/after lookups
+            sessions_in_parallel_set = frozenset(sessions_in_parallel)
+            day = session.start.date()
+            same_day_sessions = sessions_by_day[day]
+            same_day_start_times = start_times_by_day[day]
+
+            # Only pass on the sessions starting after this one ends, early first
+            first_after = bisect_left(same_day_start_times, session.end)
             sessions_after = cls.compute_sessions_after(
-                session, all_sessions, sessions_in_parallel
+                session,
+                same_day_sessions[first_after:],
+                sessions_in_parallel_set,
+            )
+            # Only pass on the sessions starting before this one, late first
+            starting_later = len(same_day_sessions) - bisect_right(
+                same_day_start_times, session.start
             )
             sessions_before = cls.compute_sessions_before(
-                session, all_sessions, sessions_in_parallel
+                session,
+                sessions_by_day_reversed[day][starting_later:],
+                sessions_in_parallel_set,
             )
 
             cls.all_sessions_in_parallel[session.code] = sessions_in_parallel
             cls.all_sessions_after[session.code] = sessions_after
             cls.all_sessions_before[session.code] = sessions_before
             cls.all_next_session[session.code] = cls.compute_prev_or_next_session(
-                session, sessions_after, all_sessions
+                session, sessions_after, sessions_by_code
             )
             cls.all_prev_session[session.code] = cls.compute_prev_or_next_session(
-                session, sessions_before, all_sessions
+                session, sessions_before, sessions_by_code
             )
 
     @classmethod
@@ -63,19 +117,28 @@ class TimingRelationships:
     @staticmethod
     def compute_sessions_in_parallel(
         session: PretalxSubmission,
-        all_sessions: ValuesView[PretalxSubmission] | list[PretalxSubmission],
+        sessions_by_start: list[PretalxSubmission],
+        start_times: list[datetime],
+        longest_duration: timedelta,
     ) -> list[str]:
+        """
+        ``sessions_by_start`` must be the scheduled sessions sorted based on start
+        time, ``start_times`` their start times in the same order, and
+        ``longest_duration`` the duration of the longest one of them
+        """
+        # Only the sessions starting before this one ends, but not earlier than
+        # the longest session would need to still be running, can intersect
+        code, start, end = session.code, session.start, session.end
+        first = bisect_right(start_times, start - longest_duration)
+        last = bisect_left(start_times, end)
+
         sessions_parallel = []
-        for other_session in all_sessions:
-            if (
-                other_session.code == session.code
-                or other_session.start is None
-                or session.start is None
-            ):
+        for other_session in sessions_by_start[first:last]:
+            if other_session.code == code:
                 continue
 
             # If they intersect, they are in parallel
-            if other_session.start < session.end and other_session.end > session.start:
+            if other_session.end > start:
                 sessions_parallel.append(other_session.code)
 
         return sessions_parallel
@@ -83,69 +146,60 @@ class TimingRelationships:
     @staticmethod
     def compute_sessions_after(
         session: PretalxSubmission,
-        all_sessions: ValuesView[PretalxSubmission] | list[PretalxSubmission],
-        sessions_in_parallel: list[str],
+        same_day_sessions: list[PretalxSubmission],
+        sessions_in_parallel: frozenset[str],
     ) -> list[str]:
-        # Sort sessions based on start time, early first
-        all_sessions_sorted = sorted(
-            all_sessions, key=lambda x: (x.start is None, x.start)
-        )
+        """
+        ``same_day_sessions`` must be the sessions of the same day, sorted based on
+        start time, early first
+        """
+        code, end, submission_type = session.code, session.end, session.submission_type
 
         # Filter out sessions
         remaining_sessions = [
             other_session
-            for other_session in all_sessions_sorted
-            if other_session.start is not None
-            and other_session.start >= session.end
+            for other_session in same_day_sessions
+            if other_session.start >= end
             and other_session.code not in sessions_in_parallel
-            and other_session.code != session.code
-            and other_session.start.day == session.start.day
-            and not other_session.submission_type
-            == session.submission_type
-            == "Announcements"
+            and other_session.code != code
+            and not other_session.submission_type == submission_type == "Announcements"
         ]
 
-        # Add sessions to the list if they are in different rooms
+        # Add sessions to the list if they are in different rooms, keep the keynotes
+        # apart at the same time
         seen_rooms = set()
-        unique_sessions: list[PretalxSubmission] = []
+        sessions_after: list[str] = []
+        keynotes_after: list[str] = []
 
         for other_session in remaining_sessions:
             if other_session.room not in seen_rooms:
-                unique_sessions.append(other_session)
+                sessions_after.append(other_session.code)
+                if other_session.submission_type == "Keynote":
+                    keynotes_after.append(other_session.code)
                 seen_rooms.add(other_session.room)
 
-        # If there is a keynote next, only show that
-        if any(s.submission_type == "Keynote" for s in unique_sessions):
-            unique_sessions = [
-                s for s in unique_sessions if s.submission_type == "Keynote"
-            ]
-
-        # Set the next sessions in all rooms
-        sessions_after = [s.code for s in unique_sessions]
-
-        return sessions_after
+        # If there is a keynote next, only show that, otherwise the next sessions
+        # in all rooms
+        return keynotes_after or sessions_after
 
     @staticmethod
     def compute_sessions_before(
         session: PretalxSubmission,
-        all_sessions: ValuesView[PretalxSubmission] | list[PretalxSubmission],
-        sessions_in_parallel: list[str],
+        same_day_sessions: list[PretalxSubmission],
+        sessions_in_parallel: frozenset[str],
     ) -> list[str]:
-        # Sort sessions based on start time, late first
-        all_sessions_sorted = sorted(
-            all_sessions,
-            key=lambda x: (x.start is None, x.start),
-            reverse=True,
-        )
+        """
+        ``same_day_sessions`` must be the sessions of the same day, sorted based on
+        start time, late first
+        """
+        code, start = session.code, session.start
 
         remaining_sessions = [
             other_session
-            for other_session in all_sessions_sorted
-            if other_session.start is not None
-            and other_session.code not in sessions_in_parallel
-            and other_session.start <= session.start
-            and other_session.code != session.code
-            and other_session.start.day == session.start.day
+            for other_session in same_day_sessions
+            if other_session.code not in sessions_in_parallel
+            and other_session.start <= start
+            and other_session.code != code
             and other_session.submission_type != "Announcements"
         ]
 
@@ -165,20 +219,27 @@ class TimingRelationships:
     def compute_prev_or_next_session(
         session: PretalxSubmission,
         sessions_before_or_after: list[str],
-        all_sessions: ValuesView[PretalxSubmission] | list[PretalxSubmission],
+        sessions_by_code: dict[str, tuple[int, PretalxSubmission]],
     ) -> str | None:
         """
         Compute next_session or prev_session based on the given sessions_before_or_after.
         If passed sessions_before, it will return prev_session.
         If passed sessions_after, it will return next_session.
 
+        ``sessions_by_code`` maps the session codes to their position in the list of
+        all sessions and the session itself.
+
         Returns the previous or next session in the same room or a keynote.
         """
         if not sessions_before_or_after:
             return None
 
+        # Look the sessions up by code, in the same order as in all the sessions
         sessions_before_or_after_object = [
-            s for s in all_sessions if s.code in sessions_before_or_after
+            sessions_by_code[code][1]
+            for code in sorted(
+                sessions_before_or_after, key=lambda code: sessions_by_code[code][0]
+            )
         ]
 
         session_in_same_room = None
@@ -21,13 +21,12 @@ class Transform:
         Transforms the given Pretalx submissions to EuroPython sessions
         """
         # Sort the submissions based on start time for deterministic slug computation
-        submissions = {
-            k: v
-            for k, v in sorted(
+        submissions = dict(
+            sorted(
                 submissions.items(),
                 key=lambda item: (item[1].start is None, item[1].start),
             )
-        }
+        )
 
         session_code_to_slug = Utils.compute_unique_slugs_by_attribute(
             submissions, "title"
@@ -73,7 +72,7 @@ class Transform:
         Transforms the given Pretalx speakers to EuroPython speakers
         """
         # Sort the speakers based on code for deterministic slug computation
-        speakers = {k: v for k, v in sorted(speakers.items(), key=lambda item: item[0])}
+        speakers = dict(sorted(speakers.items(), key=lambda item: item[0]))
 
         speaker_code_to_slug = Utils.compute_unique_slugs_by_attribute(speakers, "name")
 
@@ -114,6 +113,19 @@ class Transform:
             )
             ep_breaks.append(ep_break)
 
+        # The schedule speakers only depend on the speaker, so build each of them once
+        # and share it between all the sessions and slots of that speaker
+        ep_schedule_speakers = {
+            code: EuroPythonScheduleSpeaker(
+                code=code,
+                name=speaker.name,
+                avatar=speaker.avatar,
+                slug=speaker.slug,
+                website_url=speaker.website_url,
+            )
+            for code, speaker in ep_speakers.items()
+        }
+
         # Split the sessions that covers multiple slots
         ep_schedule_sessions_split = []
         for session in ep_sessions.values():
@@ -128,13 +140,7 @@ class Transform:
                     title=session.title,
                     session_type=session.session_type,
                     speakers=[
-                        EuroPythonScheduleSpeaker(
-                            code=speaker_code,
-                            name=ep_speakers[speaker_code].name,
-                            avatar=ep_speakers[speaker_code].avatar,
-                            slug=ep_speakers[speaker_code].slug,
-                            website_url=ep_speakers[speaker_code].website_url,
-                        )
+                        ep_schedule_speakers[speaker_code]
                         for speaker_code in session.speakers
                     ],
                     track=session.track,
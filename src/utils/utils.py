@@ -1,9 +1,11 @@
-import json
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import KeysView
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
+from pydantic_core import to_json
 from slugify import slugify
 
 from src.misc import Room
@@ -11,13 +13,34 @@ from src.models.europython import EuroPythonSession, EuroPythonSpeaker, Schedule
 from src.models.pretalx import PretalxScheduleBreak, PretalxSpeaker, PretalxSubmission
 from src.utils.sort import Sort
 
+# Offsets of the slots of the multi-slot sessions from their start
+HALF_DAY_SLOT_OFFSETS = (timedelta(0), timedelta(minutes=90 + 15))
+FULL_DAY_SLOT_OFFSETS = (
+    timedelta(0),
+    timedelta(minutes=90 + 15),
+    timedelta(minutes=90 + 15 + 90 + 60),
+    timedelta(minutes=90 + 15 + 90 + 60 + 90 + 15),
+)
+
+
+@lru_cache(maxsize=4096)
+def cached_slugify(text: str) -> str:
+    """
+    slugify normalizes unicode and runs several regexes, so don't repeat it for
+    the titles and names that occur more than once
+    """
+    return slugify(text)
+
 
 class Utils:
     @staticmethod
     def publishable_sessions_of_speaker(
         speaker: PretalxSpeaker, accepted_proposals: KeysView[str]
-    ) -> set[str]:
-        return set(speaker.submissions) & accepted_proposals
+    ) -> list[str]:
+        # Drop repeated codes like the set intersection did, but keep the order
+        return list(
+            dict.fromkeys(s for s in speaker.submissions if s in accepted_proposals)
+        )
 
     @staticmethod
     def find_duplicate_attributes(
@@ -28,41 +51,42 @@ class Utils:
             | dict[str, PretalxSpeaker]
         ),
         attributes: list[str],
+        only_duplicates: bool = False,
     ) -> dict[str, list[str]]:
         """
-        Find duplicates in the given objects based on the given attributes
+        Find duplicates in the given objects based on the given attributes,
+        if only_duplicates is set, leave out the values of a single object
 
         Returns: dict[attribute_value, list[object_code]]
         """
-        duplicates: dict[str, list[str]] = {}
+        attribute_getters = [attrgetter(attribute) for attribute in attributes]
+        duplicates: dict[str, list[str]] = defaultdict(list)
         for obj in objects.values():
-            for attribute in attributes:
-                value = getattr(obj, attribute)
-                if value in duplicates:
-                    duplicates[value].append(obj.code)
-                else:
-                    duplicates[value] = [obj.code]
+            for get_attribute in attribute_getters:
+                duplicates[get_attribute(obj)].append(obj.code)
 
-        return duplicates
+        if only_duplicates:
+            return {
+                value: codes for value, codes in duplicates.items() if len(codes) > 1
+            }
+
+        return dict(duplicates)
 
     @staticmethod
     def replace_duplicate_slugs(code_to_slug: dict[str, str]) -> dict[str, str]:
-        slug_count: dict[str, int] = {}
-        seen_slugs: set[str] = set()
+        """
+        Keep the first occurrence of a slug as is, and add incrementing numbers
+        to the next ones: slug, slug-1, slug-2, ...
+        """
+        seen_count: Counter[str] = Counter()
+        unique_code_to_slug = {}
 
         for code, slug in code_to_slug.items():
-            original_slug = slug
-
-            if original_slug in seen_slugs:
-                if original_slug in slug_count:
-                    slug_count[original_slug] += 1
-                else:
-                    slug_count[original_slug] = 1
-                code_to_slug[code] = f"{original_slug}-{slug_count[original_slug]}"
-            else:
-                seen_slugs.add(original_slug)
+            count = seen_count[slug]
+            seen_count[slug] += 1
+            unique_code_to_slug[code] = f"{slug}-{count}" if count else slug
 
-        return code_to_slug
+        return unique_code_to_slug
 
     @staticmethod
     def warn_duplicates(
@@ -78,23 +102,21 @@ class Utils:
             f"Checking for duplicate {'s, '.join(session_attributes_to_check)}s in sessions..."
         )
         duplicate_sessions = Utils.find_duplicate_attributes(
-            sessions_to_check, session_attributes_to_check
+            sessions_to_check, session_attributes_to_check, only_duplicates=True
         )
 
         for attribute, codes in duplicate_sessions.items():
-            if len(codes) > 1:
-                print(f"Duplicate ``{attribute}`` in sessions: {codes}")
+            print(f"Duplicate ``{attribute}`` in sessions: {codes}")
 
         print(
             f"Checking for duplicate {'s, '.join(speaker_attributes_to_check)}s in speakers..."
         )
         duplicate_speakers = Utils.find_duplicate_attributes(
-            speakers_to_check, speaker_attributes_to_check
+            speakers_to_check, speaker_attributes_to_check, only_duplicates=True
         )
 
         for attribute, codes in duplicate_speakers.items():
-            if len(codes) > 1:
-                print(f"Duplicate ``{attribute}`` in speakers: {codes}")
+            print(f"Duplicate ``{attribute}`` in speakers: {codes}")
 
     @staticmethod
     def compute_unique_slugs_by_attribute(
@@ -110,7 +132,7 @@ class Utils:
         """
         object_code_to_slug = {}
         for obj in objects.values():
-            object_code_to_slug[obj.code] = slugify(getattr(obj, attribute))
+            object_code_to_slug[obj.code] = cached_slugify(getattr(obj, attribute))
 
         return Utils.replace_duplicate_slugs(object_code_to_slug)
 
@@ -149,16 +171,11 @@ class Utils:
 
         if (is_tutorial or is_workshop) and session.slot_count == 2:
             # Half day workshops and tutorials have 2 slots, 90 minutes each, with a 15-minute break in between
-            return [session.start, session.start + timedelta(minutes=90 + 15)]
+            return [session.start + offset for offset in HALF_DAY_SLOT_OFFSETS]
 
         elif is_workshop and session.slot_count == 4:
             # Full day workshops have 4 slots, 90 minutes each, with 15-minute breaks in between, and a 1-hour lunch break after the 2nd slot
-            return [
-                session.start,
-                session.start + timedelta(minutes=90 + 15),
-                session.start + timedelta(minutes=90 + 15 + 90 + 60),
-                session.start + timedelta(minutes=90 + 15 + 90 + 60 + 90 + 15),
-            ]
+            return [session.start + offset for offset in FULL_DAY_SLOT_OFFSETS]
 
         return [session.start]
 
@@ -171,16 +188,17 @@ class Utils:
         Path(output_file).parent.absolute().mkdir(parents=True, exist_ok=True)
 
         if not direct_dump:
-            with open(output_file, "w") as fd:
-                json.dump(
-                    Sort.sort_nested(
-                        {k: json.loads(v.model_dump_json()) for k, v in data.items()}
-                    ),
-                    fd,
-                    indent=2,
-                )
+            # Write the objects one by one instead of building the whole dict first,
+            # the output is the same as dumping the sorted dict with an indent of 2
+            with open(output_file, "wb") as fd:
+                fd.write(b"{")
+                for i, key in enumerate(sorted(data)):
+                    value = Sort.sort_nested(data[key].model_dump(mode="json"))
+                    fd.write(b",\n  " if i else b"\n  ")
+                    fd.write(to_json(key) + b": ")
+                    fd.write(to_json(value, indent=2).replace(b"\n", b"\n  "))
+                fd.write(b"\n}" if data else b"}")
         else:
-            with open(output_file, "w") as fd:
-                json.dump(
-                    Sort.sort_nested(json.loads(data.model_dump_json())), fd, indent=2
-                )
+            Path(output_file).write_bytes(
+                to_json(Sort.sort_nested(data.model_dump(mode="json")), indent=2)
+            )
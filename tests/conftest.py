@@ -0,0 +1,35 @@
+from collections.abc import Callable
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def raw_submission() -> Callable[..., dict]:
+    """
+    Builds the Pretalx data of a submission, as it is in the API export
+    """
+
+    def build(
+        code: str, slot: dict | None = None, submission_type: dict | str | None = None
+    ) -> dict:
+        return {
+            "code": code,
+            "title": code,
+            "speakers": [{"code": "SPK2"}, {"code": "SPK1"}],
+            "submission_type": submission_type or {"en": "Talk"},
+            "track": None,
+            "state": "confirmed",
+            "abstract": "",
+            "duration": 30,
+            "resources": [],
+            "slot_count": 1,
+            "slot": slot,
+            "answers": [
+                {
+                    "question": {"id": 1, "question": {"en": "Outline"}},
+                    "answer": "outline",
+                }
+            ],
+        }
+
+    return build
@@ -0,0 +1,113 @@
+import json
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.pretalx import PretalxSubmission
+from src.utils.parse import Parse
+
+tz = timezone(timedelta(hours=2))
+
+
+@pytest.mark.parametrize(
+    "room",
+    [{"en": "Forum Hall", "de": "Forum Halle"}, "Forum Hall"],
+    ids=["localized", "plain"],
+)
+def test_submission_slot(room: dict | str, raw_submission: Callable) -> None:
+    submission = PretalxSubmission.model_validate(
+        raw_submission(
+            "A",
+            {
+                "room": room,
+                "start": "2024-07-10T10:00:00+02:00",
+                "end": "2024-07-10T10:30:00+02:00",
+            },
+        )
+    )
+
+    assert submission.room == "Forum Hall"
+    assert submission.start == datetime(2024, 7, 10, 10, 0, tzinfo=tz)
+    assert submission.end == datetime(2024, 7, 10, 10, 30, tzinfo=tz)
+    assert submission.submission_type == "Talk"
+    assert submission.speakers == ["SPK1", "SPK2"]
+    assert submission.answers == {"Outline": "outline"}
+
+
+def test_submission_without_slot(raw_submission: Callable) -> None:
+    submission = PretalxSubmission.model_validate(raw_submission("A", None))
+
+    assert submission.room is None
+    assert submission.start is None
+    assert submission.end is None
+
+
+@pytest.mark.parametrize(
+    "slot",
+    [
+        "2024-07-10T10:00:00+02:00",
+        [],
+        {"room": "Forum Hall", "start": "2024-07-10T10:00:00+02:00"},
+    ],
+    ids=["string", "list", "no-end"],
+)
+def test_submission_malformed_slot(
+    slot: str | list | dict, raw_submission: Callable
+) -> None:
+    with pytest.raises(ValidationError, match="Malformed slot"):
+        PretalxSubmission.model_validate(raw_submission("A", slot))
+
+
+def test_submission_missing_slot(raw_submission: Callable) -> None:
+    submission = raw_submission("A", None)
+    del submission["slot"]
+
+    with pytest.raises(ValidationError, match="Submission has no slot"):
+        PretalxSubmission.model_validate(submission)
+
+
+def test_schedule(tmp_path: Path, raw_submission: Callable) -> None:
+    schedule_file = tmp_path / "schedule.json"
+    schedule_file.write_text(
+        json.dumps(
+            {
+                "slots": [
+                    raw_submission(
+                        "A",
+                        {
+                            "room": {"en": "Terrace 2A"},
+                            "start": "2024-07-10T10:00:00+02:00",
+                            "end": "2024-07-10T10:30:00+02:00",
+                        },
+                    )
+                ],
+                "breaks": [
+                    {
+                        "room": {"en": "Forum Hall"},
+                        "start": "2024-07-10T12:00:00+02:00",
+                        "end": "2024-07-10T13:00:00+02:00",
+                        "description": {"en": "Lunch", "de": "Mittagessen"},
+                    },
+                    {
+                        "room": "Terrace 2A",
+                        "start": "2024-07-10T12:00:00+02:00",
+                        "end": "2024-07-10T13:00:00+02:00",
+                        "description": "Lunch",
+                    },
+                ],
+            }
+        )
+    )
+
+    schedule = Parse.schedule(schedule_file)
+
+    assert [slot.room for slot in schedule.slots] == ["Terrace 2A"]
+    assert [(b.room, b.description) for b in schedule.breaks] == [
+        ("Forum Hall", "Lunch"),
+        ("Terrace 2A", "Lunch"),
+    ]
+    assert schedule.breaks[0].start == datetime(2024, 7, 10, 12, 0, tzinfo=tz)
+    assert schedule.breaks[0].end == datetime(2024, 7, 10, 13, 0, tzinfo=tz)
@@ -0,0 +1,18 @@
+from src.models.pretalx import PretalxSpeaker
+from src.utils.utils import Utils
+
+
+def test_publishable_sessions_of_speaker() -> None:
+    speaker = PretalxSpeaker(
+        code="SPK1",
+        name="Speaker",
+        avatar="",
+        submissions=["B", "A", "REJECTED", "B"],
+        answers=[],
+    )
+    accepted_proposals = {"A": None, "B": None}.keys()
+
+    assert Utils.publishable_sessions_of_speaker(speaker, accepted_proposals) == [
+        "B",
+        "A",
+    ]
@@ -0,0 +1,144 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.models.pretalx import PretalxSubmission
+from src.utils.timing_relationships import TimingRelationships
+
+# Code, submission type, room, start, end and day of the scheduled sessions
+schedule = [
+    ("LONG", "Tutorial", "Room C", "09:00", "12:00", 10),
+    ("A1", "Talk", "Room A", "09:00", "09:30", 10),
+    ("B1", "Talk", "Room B", "09:00", "09:30", 10),
+    ("A2", "Talk", "Room A", "09:30", "10:00", 10),
+    ("ZERO", "Talk", "Room B", "09:30", "09:30", 10),
+    ("B2", "Talk", "Room B", "09:30", "10:00", 10),
+    ("LATE", "Talk", "Room A", "11:45", "12:15", 10),
+    ("EDGE", "Talk", "Room B", "12:00", "12:30", 10),
+    ("ANN", "Announcements", "Forum Hall", "08:30", "08:45", 10),
+    ("ANN2", "Announcements", "Forum Hall", "12:30", "12:45", 10),
+    ("ANN3", "Announcements", "Forum Hall", "13:00", "13:15", 10),
+    ("A3", "Talk", "Room A", "13:00", "13:30", 10),
+    ("D2A", "Talk", "Room A", "09:00", "09:30", 11),
+    ("D2KEY", "Keynote", "Forum Hall", "09:30", "10:30", 11),
+    ("D2B", "Talk", "Room B", "09:30", "10:00", 11),
+    ("D2A2", "Talk", "Room A", "10:30", "11:00", 11),
+]
+
+
+@pytest.fixture
+def submissions(raw_submission: Callable) -> dict[str, PretalxSubmission]:
+    submissions = {
+        code: PretalxSubmission.model_validate(
+            raw_submission(
+                code,
+                {
+                    "room": room,
+                    "start": f"2024-07-{day}T{start}:00+02:00",
+                    "end": f"2024-07-{day}T{end}:00+02:00",
+                },
+                submission_type,
+            )
+        )
+        for code, submission_type, room, start, end, day in schedule
+    }
+    submissions["NOSLOT"] = PretalxSubmission.model_validate(raw_submission("NOSLOT"))
+    return submissions
+
+
+@pytest.fixture(autouse=True)
+def computed(submissions: dict[str, PretalxSubmission]) -> None:
+    TimingRelationships.compute(list(submissions.values()))
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        # LONG starts before the sessions it overlaps, EDGE only touches its end
+        ("LONG", ["A1", "B1", "A2", "ZERO", "B2", "LATE"]),
+        ("LATE", ["LONG", "EDGE"]),
+        ("EDGE", ["LATE"]),
+        # Sessions starting at the same time
+        ("A1", ["LONG", "B1"]),
+        ("B1", ["LONG", "A1"]),
+        ("ZERO", ["LONG"]),
+        ("A3", ["ANN3"]),
+        # Sessions on other days are never in parallel
+        ("D2A", []),
+        ("D2KEY", ["D2B"]),
+        ("NOSLOT", None),
+    ],
+)
+def test_sessions_in_parallel(code: str, expected: list[str] | None) -> None:
+    assert TimingRelationships.get_sessions_in_parallel(code) == expected
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        # Announcements are never listed before a session
+        ("A1", []),
+        ("A2", ["ZERO", "A1"]),
+        ("ZERO", ["A2", "B2"]),
+        ("EDGE", ["A2", "ZERO", "LONG"]),
+        ("A3", ["EDGE", "LATE", "LONG"]),
+        ("D2A", []),
+        ("D2A2", ["D2KEY", "D2B", "D2A"]),
+        ("NOSLOT", None),
+    ],
+)
+def test_sessions_before(code: str, expected: list[str] | None) -> None:
+    assert TimingRelationships.get_sessions_before(code) == expected
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        ("ANN", ["LONG", "A1", "B1"]),
+        ("A1", ["A2", "ZERO", "ANN2"]),
+        ("ZERO", ["A2", "B2", "ANN2"]),
+        ("LATE", ["ANN2", "A3"]),
+        # Announcements are not followed by other announcements
+        ("ANN2", ["A3"]),
+        ("ANN3", []),
+        # A keynote after the session hides the other sessions
+        ("D2A", ["D2KEY"]),
+        ("D2B", ["D2A2"]),
+        ("NOSLOT", None),
+    ],
+)
+def test_sessions_after(code: str, expected: list[str] | None) -> None:
+    assert TimingRelationships.get_sessions_after(code) == expected
+
+
+@pytest.mark.parametrize(
+    ("code", "prev_session", "next_session"),
+    [
+        ("A1", None, "A2"),
+        ("B1", None, "ZERO"),
+        ("A2", "A1", "LATE"),
+        ("B2", "ZERO", "EDGE"),
+        ("LATE", "A2", "A3"),
+        ("LONG", None, None),
+        # The keynote is picked even though it is in another room
+        ("D2A", None, "D2KEY"),
+        ("D2A2", "D2A", None),
+        ("NOSLOT", None, None),
+    ],
+)
+def test_prev_and_next_session(
+    code: str, prev_session: str | None, next_session: str | None
+) -> None:
+    assert TimingRelationships.get_prev_session(code) == prev_session
+    assert TimingRelationships.get_next_session(code) == next_session
+
+
+def test_compute_clears_previous_results(
+    submissions: dict[str, PretalxSubmission],
+) -> None:
+    TimingRelationships.compute([submissions["D2A"]])
+
+    assert TimingRelationships.get_sessions_in_parallel("D2A") == []
+    assert TimingRelationships.get_sessions_after("D2A") == []
+    assert TimingRelationships.get_sessions_in_parallel("LONG") is None
+    assert TimingRelationships.get_next_session("LONG") is None
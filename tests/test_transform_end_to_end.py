@@ -1,5 +1,8 @@
 import json
 
+from pydantic import TypeAdapter
+
+from src.models.europython import EuroPythonSession, EuroPythonSpeaker
 from src.utils.parse import Parse
 from src.utils.timing_relationships import TimingRelationships
 from src.utils.transform import Transform
@@ -10,6 +13,9 @@ pretalx_submissions = Parse.publishable_submissions(
 
 youtube_data = Parse.youtube("./data/examples/pretalx/youtube.json")
 
+sessions_adapter = TypeAdapter(dict[str, EuroPythonSession])
+speakers_adapter = TypeAdapter(dict[str, EuroPythonSpeaker])
+
 
 def test_e2e_sessions() -> None:
     TimingRelationships.compute(pretalx_submissions.values())
@@ -18,9 +24,7 @@ def test_e2e_sessions() -> None:
         pretalx_submissions,
         youtube_data,
     )
-    ep_sessions_dump = {
-        k: json.loads(v.model_dump_json()) for k, v in ep_sessions.items()
-    }
+    ep_sessions_dump = sessions_adapter.dump_python(ep_sessions, mode="json")
 
     with open("./data/examples/europython/sessions.json") as fd:
         ep_sessions_expected = json.load(fd)
@@ -33,9 +37,7 @@ def test_e2e_speakers() -> None:
         "./data/examples/pretalx/speakers.json", pretalx_submissions.keys()
     )
     ep_speakers = Transform.pretalx_speakers_to_europython_speakers(pretalx_speakers)
-    ep_speakers_dump = {
-        k: json.loads(v.model_dump_json()) for k, v in ep_speakers.items()
-    }
+    ep_speakers_dump = speakers_adapter.dump_python(ep_speakers, mode="json")
 
     with open("./data/examples/europython/speakers.json") as fd:
         ep_speakers_expected = json.load(fd)
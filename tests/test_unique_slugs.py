@@ -0,0 +1,19 @@
+from src.utils.utils import Utils
+
+
+def test_replace_duplicate_slugs() -> None:
+    code_to_slug = {
+        "A": "talk",
+        "B": "other-talk",
+        "C": "talk",
+        "D": "talk",
+        "E": "other-talk",
+    }
+
+    assert Utils.replace_duplicate_slugs(code_to_slug) == {
+        "A": "talk",
+        "B": "other-talk",
+        "C": "talk-1",
+        "D": "talk-2",
+        "E": "other-talk-1",
+    }
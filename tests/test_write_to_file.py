@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from pydantic_core import to_json
+
+from src.models.europython import EuroPythonSession
+from src.utils.sort import Sort
+from src.utils.utils import Utils
+
+start = datetime(2024, 7, 10, 10, 0, tzinfo=timezone(timedelta(hours=2)))
+
+session_a = EuroPythonSession(
+    code="A",
+    title="Café & code — ünïcode",
+    speakers=["SPK2", "SPK1"],
+    session_type="Talk",
+    slug="cafe-code-unicode",
+    resources=[
+        {"resource": "https://example.com/b", "description": "Slides ✨"},
+        {"resource": "https://example.com/a", "description": "Code"},
+    ],
+    room="Forum Hall",
+    start=start,
+    end=start + timedelta(minutes=30),
+    sessions_in_parallel=["C", "B"],
+    slot_count=1,
+)
+session_b = EuroPythonSession(
+    code="B",
+    title="Second talk",
+    speakers=["SPK3"],
+    session_type="Tutorial",
+    slug="second-talk",
+    slot_count=2,
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"A": session_a},
+        {"B": session_b, "A": session_a},
+    ],
+    ids=["empty", "one", "many"],
+)
+def test_write_to_file(tmp_path: Path, data: dict[str, EuroPythonSession]) -> None:
+    output_file = tmp_path / "sessions.json"
+
+    Utils.write_to_file(output_file, data)
+
+    expected = to_json(
+        Sort.sort_nested({k: v.model_dump(mode="json") for k, v in data.items()}),
+        indent=2,
+    )
+    assert output_file.read_bytes() == expected
+
+
+def test_write_to_file_literal(tmp_path: Path) -> None:
+    output_file = tmp_path / "sessions.json"
+
+    Utils.write_to_file(output_file, {})
+    assert output_file.read_text() == "{}"
+
+    Utils.write_to_file(output_file, {"B": session_b})
+    assert output_file.read_text() == (
+        "{\n"
+        '  "B": {\n'
+        '    "abstract": "",\n'
+        '    "code": "B",\n'
+        '    "delivery": "",\n'
+        '    "duration": "",\n'
+        '    "end": null,\n'
+        '    "level": "",\n'
+        '    "next_session": null,\n'
+        '    "prev_session": null,\n'
+        '    "resources": null,\n'
+        '    "room": null,\n'
+        '    "session_type": "Tutorial",\n'
+        '    "sessions_after": null,\n'
+        '    "sessions_before": null,\n'
+        '    "sessions_in_parallel": null,\n'
+        '    "slug": "second-talk",\n'
+        '    "speakers": [\n'
+        '      "SPK3"\n'
+        "    ],\n"
+        '    "start": null,\n'
+        '    "title": "Second talk",\n'
+        '    "track": null,\n'
+        '    "tweet": "",\n'
+        '    "website_url": "https://ep2024.europython.eu/session/second-talk",\n'
+        '    "youtube_url": null\n'
+        "  }\n"
+        "}"
+    )
+
+    Utils.write_to_file(output_file, {"B": session_b, "A": session_a})
+    assert '\n    "youtube_url": null\n  },\n  "B": {\n' in output_file.read_text()